@@ -53,6 +53,15 @@ Kirigami.ApplicationWindow {
     pageStack.initialPage: Kirigami.Page {
         padding: 0
         
+        // One tooltip for the whole grid, moved to whichever video is hovered,
+        // instead of one per delegate
+        Controls.ToolTip {
+            id: sharedTooltip
+            delay: 500
+            timeout: 5000
+            width: Math.min(implicitWidth, Kirigami.Units.gridUnit * 25)
+        }
+        
         ColumnLayout {
             anchors.fill: parent
             spacing: 0
@@ -129,6 +138,16 @@ Kirigami.ApplicationWindow {
                         stepSize: 20
                         value: 160
                         Layout.preferredWidth: 100
+                        
+                        // Resize the grid once the slider settles rather than on every step
+                        onValueChanged: resizeTimer.restart()
+                        
+                        Timer {
+                            id: resizeTimer
+                            interval: 80
+                            repeat: false
+                            onTriggered: galleryGrid.thumbnailSize = thumbnailSizeSlider.value
+                        }
                     }
                 }
             }
@@ -147,8 +166,35 @@ Kirigami.ApplicationWindow {
                         // This ensures the model is properly processed
                         console.log("Grid view initialized with " + count + " items")
                     }
-                    cellWidth: thumbnailSizeSlider.value + Kirigami.Units.largeSpacing
-                    cellHeight: thumbnailSizeSlider.value + 40 // Extra space for caption
+                    // Debounced copy of the size slider's value
+                    property int thumbnailSize: 160
+                    cellWidth: thumbnailSize + Kirigami.Units.largeSpacing
+                    cellHeight: thumbnailSize + 40 // Extra space for caption
+                    
+                    // Keep a few rows of delegates around the viewport and recycle them
+                    // instead of destroying and recreating them while scrolling
+                    cacheBuffer: Math.max(600, cellHeight * 3)
+                    reuseItems: true
+                    
+                    // Tell the backend which rows are on screen (plus two rows either side)
+                    // so their thumbnails are generated first
+                    onContentYChanged: visibleRangeTimer.restart()
+                    onHeightChanged: visibleRangeTimer.restart()
+                    onCountChanged: visibleRangeTimer.restart()
+                    
+                    Timer {
+                        id: visibleRangeTimer
+                        interval: 50
+                        repeat: false
+                        onTriggered: {
+                            var columns = Math.max(1, Math.floor(galleryGrid.width / galleryGrid.cellWidth))
+                            var first = galleryGrid.indexAt(galleryGrid.width / 2, galleryGrid.contentY)
+                            var last = galleryGrid.indexAt(galleryGrid.width / 2, galleryGrid.contentY + galleryGrid.height)
+                            if (first < 0) first = 0
+                            if (last < 0) last = galleryGrid.count - 1
+                            gallery.setVisibleRange(first - 2 * columns, last + 2 * columns)
+                        }
+                    }
                     
                     delegate: Item {
                         width: galleryGrid.cellWidth
@@ -158,46 +204,57 @@ Kirigami.ApplicationWindow {
                         Rectangle {
                             id: thumbnailContainer
                             anchors.centerIn: parent
-                            width: thumbnailSizeSlider.value
-                            height: thumbnailSizeSlider.value
+                            width: galleryGrid.thumbnailSize
+                            height: galleryGrid.thumbnailSize
                             color: "black"
                             border.width: mouseArea.containsMouse ? 3 : 1
                             border.color: mouseArea.containsMouse ? Kirigami.Theme.highlightColor : Kirigami.Theme.disabledTextColor
                             radius: 5
                             
-                            // Video thumbnail
-                            Image {
-                                id: thumbnail
+                            // Video thumbnail, built incrementally so scrolling doesn't stall
+                            Loader {
+                                id: thumbnailLoader
                                 anchors.fill: parent
                                 anchors.margins: 2
-                                source: model.thumbnailPath || "qrc:///icons/video-x-generic"
-                                fillMode: Image.PreserveAspectCrop
                                 asynchronous: true
-                                cache: true
                                 
-                                // Placeholder while loading
-                                Rectangle {
-                                    anchors.fill: parent
-                                    color: Kirigami.Theme.backgroundColor
-                                    visible: thumbnail.status !== Image.Ready
+                                sourceComponent: Component {
+                                    Image {
+                                        id: thumbnail
+                                        source: model.thumbnailPath || "qrc:///icons/video-x-generic"
+                                        fillMode: Image.PreserveAspectCrop
+                                        // Decode no larger than the biggest cell; kept fixed rather than bound
+                                        // to the slider so resizing doesn't miss the image cache
+                                        sourceSize.width: thumbnailSizeSlider.to
+                                        sourceSize.height: thumbnailSizeSlider.to
+                                        asynchronous: true
+                                        cache: true
+                                
+                                        // Placeholder while loading
+                                        Rectangle {
+                                            anchors.fill: parent
+                                            color: Kirigami.Theme.backgroundColor
+                                            visible: thumbnail.status !== Image.Ready
                                     
-                                    Kirigami.Icon {
-                                        anchors.centerIn: parent
-                                        source: "video-x-generic"
-                                        width: 48
-                                        height: 48
-                                    }
-                                }
+                                            Kirigami.Icon {
+                                                anchors.centerIn: parent
+                                                source: "video-x-generic"
+                                                width: 48
+                                                height: 48
+                                            }
+                                        }
                                 
-                                // Play icon overlay
-                                Kirigami.Icon {
-                                    anchors.centerIn: parent
-                                    source: "media-playback-start"
-                                    width: 32
-                                    height: 32
-                                    color: "white"
-                                    opacity: mouseArea.containsMouse ? 1.0 : 0.7
-                                    visible: mouseArea.containsMouse
+                                        // Play icon overlay
+                                        Kirigami.Icon {
+                                            anchors.centerIn: parent
+                                            source: "media-playback-start"
+                                            width: 32
+                                            height: 32
+                                            color: "white"
+                                            opacity: mouseArea.containsMouse ? 1.0 : 0.7
+                                            visible: mouseArea.containsMouse
+                                        }
+                                    }
                                 }
                             }
                             
@@ -239,36 +296,15 @@ Kirigami.ApplicationWindow {
                             anchors.fill: parent
                             hoverEnabled: true
                             
-                            // Show detailed tooltip on hover
-                            Controls.ToolTip {
-                                visible: mouseArea.containsMouse
-                                delay: 500
-                                timeout: 5000
-                                
-                                contentItem: ColumnLayout {
-                                    spacing: 4
-                                    
-                                    Controls.Label {
-                                        text: "<b>" + model.filename + "</b>"
-                                        wrapMode: Text.WordWrap
-                                        Layout.maximumWidth: 300
-                                    }
-                                    
-                                    Controls.Label {
-                                        text: "<b>Size:</b> " + model.fileSizeFormatted
-                                    }
-                                    
-                                    Controls.Label {
-                                        text: "<b>Modified:</b> " + Qt.formatDateTime(model.lastModified, "yyyy-MM-dd hh:mm")
-                                    }
-                                    
-                                    Controls.Label {
-                                        text: "<b>Path:</b> " + model.filepath
-                                        elide: Text.ElideMiddle
-                                        Layout.maximumWidth: 300
-                                    }
-                                }
+                            // Show the details in the page's shared tooltip on hover
+                            onEntered: {
+                                sharedTooltip.parent = thumbnailContainer
+                                sharedTooltip.show("<b>" + model.filename + "</b><br>"
+                                                   + "<b>Size:</b> " + model.fileSizeFormatted + "<br>"
+                                                   + "<b>Modified:</b> " + model.lastModifiedFormatted + "<br>"
+                                                   + "<b>Path:</b> " + model.filepath)
                             }
+                            onExited: sharedTooltip.hide()
                             
                             onClicked: {
                                 gallery.selectVideo(model.filepath)
@@ -323,7 +359,7 @@ Kirigami.ApplicationWindow {
                     }
                     
                     Controls.Label {
-                        text: galleryGrid.count + " videos found in " + initialDirectory
+                        text: gallery.statusText
                         Layout.fillWidth: true
                         elide: Text.ElideMiddle
                     }
@@ -350,18 +386,5 @@ Kirigami.ApplicationWindow {
     Component.onCompleted: {
         console.log("Gallery started")
         console.log("Looking for videos in: " + initialDirectory)
-        
-        // Small delay to ensure the UI is ready before loading data
-        loadTimer.start()
-    }
-    
-    Timer {
-        id: loadTimer
-        interval: 100
-        repeat: false
-        onTriggered: {
-            // Set initial sort (by name)
-            gallery.sortBy(gallery.filenameRole)
-        }
     }
 }
\ No newline at end of file
@@ -6,112 +6,424 @@ import subprocess
 import tempfile
 import shutil
 import argparse
-import glob
+import heapq
+import zlib
+import concurrent.futures
+from array import array
+from functools import lru_cache, partial
 from datetime import datetime
 from pathlib import Path
-from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot, pyqtProperty, QUrl, QTimer, QVariant, QSortFilterProxyModel, QAbstractListModel, Qt, QModelIndex, QDateTime
-from PyQt5.QtGui import QGuiApplication
+from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot, pyqtProperty, QUrl, QTimer, QVariant, QAbstractListModel, Qt, QModelIndex, QDateTime, QRunnable, QThreadPool, QProcess, QMimeData
+from PyQt5.QtGui import QGuiApplication, QClipboard
 from PyQt5.QtQml import QQmlApplicationEngine, qmlRegisterType, QQmlEngine, QQmlContext
 from PyQt5.QtQuick import QQuickView
 import PyQt5
 
-class VideoInfo(QObject):
-    def __init__(self, filepath, parent=None):
-        super().__init__(parent)
-        self._filepath = filepath
-        self._filename = os.path.basename(filepath)
-        self._filesize = os.path.getsize(filepath)
-        self._last_modified = QDateTime.fromSecsSinceEpoch(int(os.path.getmtime(filepath)))
-        self._thumbnail_path = self._generate_thumbnail()
+# Common video file extensions
+VIDEO_EXTS = frozenset(('.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.webm', '.m4v', '.3gp', '.mpg', '.mpeg'))
+
+# Background ffmpeg encodes; x264 already threads each job internally, so only
+# half the cores get a job of their own
+_FFMPEG_POOL = QThreadPool()
+_FFMPEG_POOL.setMaxThreadCount(max(1, (os.cpu_count() or 1) // 2))
+
+# x264 preset for re-encodes; the bitrate budget caps quality anyway, so favour
+# speed by default, but let OTRIMMER_PRESET trade it back (e.g. "faster", "medium")
+X264_PRESET = os.environ.get("OTRIMMER_PRESET", "veryfast")
+
+# Looked up on $PATH once rather than for every thumbnail
+FFMPEG_AVAILABLE = shutil.which("ffmpeg") is not None
+
+# Fixed leading arguments of the ffmpeg and ffprobe commands, built once
+FFMPEG_ARGS = ('ffmpeg', '-y', '-hide_banner', '-loglevel', 'error', '-nostats')  # Overwrite outputs, keep stderr down to actual errors
+FFPROBE_FORMAT_ARGS = ('ffprobe', '-hide_banner', '-v', 'error', '-show_entries', 'format=duration,bit_rate',
+                       '-of', 'default=noprint_wrappers=1')
+FFPROBE_KEYFRAME_ARGS = ('ffprobe', '-hide_banner', '-v', 'error', '-select_streams', 'v:0',
+                         '-show_entries', 'packet=pts_time,flags', '-of', 'csv=p=0')
+
+# Audio bitrate of re-encodes, which comes out of the same size budget as the video
+AUDIO_BITRATE = 128000
+# Lowest video bitrate asked for, however small the size budget
+MIN_VIDEO_BITRATE = 100000
+
+# Hardware H.264 encoders to prefer over libx264, best first; OTRIMMER_ENCODER
+# picks one explicitly (e.g. "libx264" to stay on the CPU)
+HARDWARE_ENCODERS = ('h264_nvenc', 'h264_vaapi', 'h264_qsv', 'h264_videotoolbox')
+VAAPI_DEVICE = "/dev/dri/renderD128"
+
+# Trims at least this long are split at keyframes and the pieces encoded in
+# parallel, each with this many x264 threads, once there are cores for two or more
+SEGMENT_MIN_SECONDS = 30
+SEGMENT_THREADS = 8
+
+# Generated thumbnails are cached here across runs
+THUMBNAIL_DIR = os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "otrimmer", "thumbs")
+
+# Thumbnail extraction gets its own bounded pool so it can't starve directory scans;
+# the workers just wait on ffmpeg with the GIL released, so they cost next to nothing
+_THUMBNAIL_POOL = QThreadPool()
+_THUMBNAIL_POOL.setMaxThreadCount(min(8, os.cpu_count() or 1))
+
+# Fallback thumbnail (system icon), looked up once instead of once per video
+_FALLBACK_ICON = next((QUrl.fromLocalFile(icon_path).toString() for icon_path in (
+    "/usr/share/icons/breeze/mimetypes/64/video-x-generic.svg",
+    "/usr/share/icons/hicolor/64x64/mimetypes/video-x-generic.png",
+    "/usr/share/icons/hicolor/scalable/mimetypes/video-x-generic.svg",
+    "/usr/share/icons/Adwaita/64x64/mimetypes/video-x-generic.png"
+) if os.path.exists(icon_path)), "")
+
+def probe_format(path):
+    """Return the duration and bit rate of a video, running ffprobe only once per file version"""
+    # The mtime and size are part of the cache key so edited files get re-probed
+    st = os.stat(path)
+    return _probe_format(path, st.st_mtime_ns, st.st_size)
+
+@lru_cache(maxsize=128)
+def _probe_format(path, mtime_ns, size):
+    """Run ffprobe for the duration (ms) and bit rate (bit/s) of a video"""
+    result = subprocess.run((*FFPROBE_FORMAT_ARGS, path), capture_output=True, text=True, check=True)
+    
+    fields = dict(line.split('=', 1) for line in result.stdout.splitlines() if '=' in line)
+    bit_rate = fields.get('bit_rate', '')
+    return {
+        'duration': int(float(fields['duration']) * 1000),  # Convert to milliseconds
+        'bit_rate': int(bit_rate) if bit_rate.isdigit() else 0  # ffprobe reports N/A for some containers
+    }
+
+def probe_keyframes(path, start_seconds, end_seconds):
+    """Return the times in seconds of the video keyframes strictly between start and end"""
+    cmd = (*FFPROBE_KEYFRAME_ARGS, '-read_intervals', f"{start_seconds}%{end_seconds}", path)
+    result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+    
+    keyframes = []
+    for line in result.stdout.splitlines():
+        pts_time, _, flags = line.partition(',')
+        if 'K' not in flags or pts_time in ('', 'N/A'):
+            continue
+        # Reading starts at the keyframe before the interval, so filter again here
+        time = float(pts_time)
+        if start_seconds < time < end_seconds:
+            keyframes.append(time)
+    return sorted(keyframes)
+
+@lru_cache(maxsize=None)
+def video_encoder():
+    """Return the H.264 encoder to compress with, detected once per run"""
+    requested = os.environ.get("OTRIMMER_ENCODER")
+    if requested:
+        return requested
         
-    @pyqtProperty(str)
-    def filepath(self):
-        return self._filepath
+    try:
+        result = subprocess.run(['ffmpeg', '-hide_banner', '-encoders'], capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return 'libx264'
+    available = {fields[1] for fields in map(str.split, result.stdout.splitlines()) if len(fields) > 1}
+    
+    for encoder in HARDWARE_ENCODERS:
+        if encoder not in available:
+            continue
+        # Being built into ffmpeg doesn't mean the hardware is there, so try a tiny encode
+        cmd = [
+            *FFMPEG_ARGS,
+            *encoder_input_args(encoder),
+            '-f', 'lavfi', '-i', 'color=size=256x256:duration=0.1',
+            *encoder_output_args(encoder, 1000000),
+            '-f', 'null', '-'
+        ]
+        try:
+            if run_ffmpeg(cmd, timeout=10).returncode == 0:
+                return encoder
+        except subprocess.TimeoutExpired:
+            pass
+    return 'libx264'
+
+def encoder_input_args(encoder):
+    """Return the ffmpeg options an encoder needs ahead of the input"""
+    if encoder == 'h264_vaapi':
+        return ['-vaapi_device', VAAPI_DEVICE]
+    return []
+
+def encoder_output_args(encoder, target_bitrate, threads='auto'):
+    """Return the ffmpeg options selecting the video encoder and its target bitrate"""
+    if encoder == 'h264_nvenc':
+        return ['-c:v', encoder, '-preset', 'p4', '-rc', 'cbr', '-b:v', f"{target_bitrate}"]
+    if encoder == 'h264_vaapi':
+        # Frames are converted and uploaded to the GPU for its encoder
+        return ['-vf', 'format=nv12,hwupload', '-c:v', encoder,
+                '-b:v', f"{target_bitrate}", '-maxrate', f"{target_bitrate}"]
+    if encoder != 'libx264':
+        # Cap the peak rate too, so the average can't drift above the budget
+        return ['-c:v', encoder, '-b:v', f"{target_bitrate}", '-maxrate', f"{target_bitrate}"]
+    return [
+        '-c:v', 'libx264',
+        # Constant quality, capped so the size budget still holds; simple scenes
+        # come out smaller and better than with a fixed average bitrate
+        '-crf', '23',
+        '-maxrate', f"{target_bitrate}",
+        '-bufsize', f"{target_bitrate * 2}",
+        '-preset', X264_PRESET,
+        '-threads', '0',
+        # Frame threads across every core; sliced threads would cost quality
+        '-x264-params', f'threads={threads}:sliced-threads=0:lookahead-threads=2'
+    ]
+
+def run_ffmpeg(cmd, timeout=None):
+    """Run an ffmpeg command keeping only its error output, decoded only if it failed"""
+    # ffmpeg never gets our stdin, so a background job can't stop on a terminal read
+    result = subprocess.run(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, timeout=timeout)
+    result.stderr = result.stderr.decode(errors='replace') if result.returncode != 0 else ""
+    return result
+
+def run_ffmpeg_with_progress(cmd, duration_seconds, on_progress):
+    """Run an ffmpeg command like run_ffmpeg, calling on_progress with the percentage done"""
+    # Errors go to a file so a chatty stderr can't block ffmpeg while we read stdout
+    with tempfile.TemporaryFile() as error_output:
+        # No stdin either, so a stray 'q' in the launching terminal can't abort the
+        # encode and a backgrounded app can't get ffmpeg stopped by SIGTTIN
+        process = subprocess.Popen([cmd[0], '-progress', 'pipe:1', *cmd[1:]], stdin=subprocess.DEVNULL,
+                                   stdout=subprocess.PIPE, stderr=error_output, text=True)
         
-    @pyqtProperty(str)
-    def filename(self):
-        return self._filename
+        last_percent = -1
+        for line in process.stdout:
+            # out_time_ms is in microseconds despite its name
+            key, _, value = line.strip().partition('=')
+            if key != 'out_time_ms' or not value.isdigit() or duration_seconds <= 0:
+                continue
+            percent = min(100, int(int(value) / (duration_seconds * 10000)))
+            if percent != last_percent:
+                last_percent = percent
+                on_progress(percent)
+                
+        returncode = process.wait()
+        error_output.seek(0)
+        stderr = error_output.read().decode(errors='replace') if returncode != 0 else ""
+    return subprocess.CompletedProcess(cmd, returncode, None, stderr)
+
+SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+def format_size(size):
+    """Return human-readable file size"""
+    # Each unit is 2**10 times the previous one, so the bit length picks it directly
+    unit_index = min((size.bit_length() - 1) // 10, 5) if size > 0 else 0
+    return f"{size / (1 << (10 * unit_index)):.1f} {SIZE_UNITS[unit_index]}"
+
+def thumbnail_prefix_for(filepath):
+    """Return the part of the thumbnail file name shared by every version of a video"""
+    return f"{zlib.crc32(filepath.encode()):08x}_"
+
+def thumbnail_file_for(filepath, mtime, size):
+    """Return the cache file of the thumbnail for this version of a video"""
+    # A checksum of the filepath makes the name unique; the mtime and size make
+    # a re-encoded file miss the cache instead of showing a stale thumbnail
+    return os.path.join(THUMBNAIL_DIR, f"{thumbnail_prefix_for(filepath)}{mtime}_{size}.jpg")
+
+def thumbnails_by_prefix(thumbnail_names):
+    """Group a listing of the thumbnail cache by the video each thumbnail belongs to"""
+    groups = {}
+    prefix_length = len(thumbnail_prefix_for(""))
+    for name in thumbnail_names:
+        groups.setdefault(name[:prefix_length], []).append(name)
+    return groups
+
+def remove_stale_thumbnails(thumbnail_names, current_name):
+    """Delete the thumbnails among thumbnail_names other than the current one"""
+    for name in thumbnail_names:
+        if name != current_name:
+            try:
+                os.remove(os.path.join(THUMBNAIL_DIR, name))
+            except OSError:
+                pass
+
+def extract_thumbnail(filepath, thumbnail_path):
+    """Run ffmpeg to extract a thumbnail, returning its URL or None on failure"""
+    if not FFMPEG_AVAILABLE:
+        return None
         
-    @pyqtProperty(int)
-    def filesize(self):
-        return self._filesize
+    temp_path = None
+    try:
+        # Write to a hidden temporary file and rename it into place once complete,
+        # so a half-written thumbnail is never picked up from the cache
+        fd, temp_path = tempfile.mkstemp(prefix=".", suffix=".jpg", dir=THUMBNAIL_DIR)
+        os.close(fd)
         
-    @pyqtProperty(QDateTime)
-    def lastModified(self):
-        return self._last_modified
+        # Seeking before -i jumps straight to a keyframe; some containers seek
+        # imprecisely that way, so retry with the slower decode-seek after -i
+        for seek_args, input_args in ((['-ss', '1'], []), ([], ['-ss', '1'])):
+            cmd = [
+                *FFMPEG_ARGS,
+                '-nostdin',  # Don't listen for interactive commands
+                *seek_args,
+                '-i', filepath,
+                *input_args,
+                '-vframes', '1',
+                '-vf', 'scale=256:-1',  # Scale to width of 256px, enough for the largest grid cell
+                '-q:v', '5',
+                '-an',  # Skip the audio streams entirely
+                temp_path
+            ]
+            
+            result = run_ffmpeg(cmd, timeout=10)
+            if result.returncode == 0 and os.path.getsize(temp_path) > 0:
+                os.replace(temp_path, thumbnail_path)
+                return QUrl.fromLocalFile(thumbnail_path).toString()
+                
+        print(f"Thumbnail generation failed: {result.stderr}")
+    except Exception as e:
+        print(f"Error generating thumbnail: {e}")
+    finally:
+        if temp_path and os.path.exists(temp_path):
+            os.remove(temp_path)
+    return None
+
+def stat_or_none(path):
+    """Return os.stat of a path, or None if it doesn't exist, in a single syscall"""
+    try:
+        return os.stat(path)
+    except FileNotFoundError:
+        return None
+
+def copy_file(source_path, target_path):
+    """Copy a file and its metadata like shutil.copy2, but inside the kernel"""
+    try:
+        # copy_file_range never brings the data into userspace, and filesystems
+        # like btrfs or XFS can share the blocks instead of copying them at all
+        with open(source_path, 'rb') as source, open(target_path, 'wb') as target:
+            remaining = os.fstat(source.fileno()).st_size
+            while remaining > 0:
+                copied = os.copy_file_range(source.fileno(), target.fileno(), remaining)
+                if copied == 0:
+                    # Some filesystem pairs stop early rather than failing outright
+                    raise OSError("copy_file_range stopped before the end of the file")
+                remaining -= copied
+    except (AttributeError, OSError):
+        # Not Linux, or a pair of filesystems copy_file_range can't work across;
+        # copyfile truncates and rewrites whatever was copied so far
+        shutil.copyfile(source_path, target_path)
+    shutil.copystat(source_path, target_path)
+
+class CompressionSignals(QObject):
+    # the finished ffmpeg run (CompletedProcess), or the exception that stopped it
+    finished = pyqtSignal(object)
+
+class CompressionJob(QRunnable):
+    """Runs a compression on a QThreadPool worker"""
+    def __init__(self, compress):
+        super().__init__()
+        self._compress = compress
+        self.signals = CompressionSignals()
         
-    @pyqtProperty(str)
-    def thumbnailPath(self):
-        return self._thumbnail_path
+    def run(self):
+        try:
+            result = self._compress()
+        except Exception as e:
+            result = e
+        # Queued back to the GUI thread, which owns the trimmer's state
+        self.signals.finished.emit(result)
+
+class ThumbnailSignals(QObject):
+    # filepath, thumbnail URL
+    thumbnailReady = pyqtSignal(str, str)
+
+class ThumbnailJob(QRunnable):
+    """Extracts a video thumbnail on a QThreadPool worker"""
+    def __init__(self, filepath, thumbnail_file, signals):
+        super().__init__()
+        self._filepath = filepath
+        self._thumbnail_file = thumbnail_file
+        self._signals = signals
         
-    @pyqtProperty(str)
-    def fileSizeFormatted(self):
-        """Return human-readable file size"""
-        size = self._filesize
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if size < 1024.0:
-                return f"{size:.1f} {unit}"
-            size /= 1024.0
-        return f"{size:.1f} PB"
+    def run(self):
+        thumbnail_path = extract_thumbnail(self._filepath, self._thumbnail_file) or _FALLBACK_ICON
+        # Queued back to the GUI thread that owns the model
+        self._signals.thumbnailReady.emit(self._filepath, thumbnail_path)
+
+class DirectoryScanSignals(QObject):
+    # generation, {model column name: values}, {filepath: cached thumbnail URL}
+    batchReady = pyqtSignal(int, object, object)
+
+class DirectoryScanJob(QRunnable):
+    """Lists the videos of a directory on a QThreadPool worker, reporting them in batches"""
+    BATCH_SIZE = 64
+    
+    def __init__(self, directory, generation):
+        super().__init__()
+        self._directory = directory
+        self._generation = generation
+        self.signals = DirectoryScanSignals()
+        self._thumbnail_groups = {}
         
-    def _generate_thumbnail(self):
-        """Generate a thumbnail for the video"""
+    def run(self):
+        # List the thumbnail cache once rather than checking each video's thumbnail
         try:
-            # Create a unique filename for the thumbnail
-            thumbnail_dir = os.path.join(tempfile.gettempdir(), "otrimmer_thumbnails")
-            os.makedirs(thumbnail_dir, exist_ok=True)
-            
-            # Use hash of filepath to create a unique thumbnail name
-            import hashlib
-            hash_object = hashlib.md5(self._filepath.encode())
-            hash_name = hash_object.hexdigest()
-            thumbnail_path = os.path.join(thumbnail_dir, f"{hash_name}.jpg")
-            
-            # Check if thumbnail already exists
-            if os.path.exists(thumbnail_path):
-                return QUrl.fromLocalFile(thumbnail_path).toString()
-                
-            # Use ffmpeg to extract a thumbnail
-            if shutil.which("ffmpeg"):
-                cmd = [
-                    'ffmpeg',
-                    '-y',
-                    '-i', self._filepath,
-                    '-ss', '00:00:01',  # Take frame from 1 second in
-                    '-vframes', '1',
-                    '-vf', 'scale=320:-1',  # Scale to width of 320px
-                    thumbnail_path
-                ]
-                
-                try:
-                    result = subprocess.run(cmd, capture_output=True, timeout=10)
-                    if os.path.exists(thumbnail_path):
-                        return QUrl.fromLocalFile(thumbnail_path).toString()
-                    else:
-                        print(f"Thumbnail generation failed: {result.stderr}")
-                except Exception as e:
-                    print(f"Error generating thumbnail: {e}")
-                    # Fall back to placeholder if thumbnail generation fails
-            
-            # Return a fallback icon path (system icon)
-            standard_icon_paths = [
-                "/usr/share/icons/breeze/mimetypes/64/video-x-generic.svg",
-                "/usr/share/icons/hicolor/64x64/mimetypes/video-x-generic.png",
-                "/usr/share/icons/hicolor/scalable/mimetypes/video-x-generic.svg",
-                "/usr/share/icons/Adwaita/64x64/mimetypes/video-x-generic.png"
-            ]
+            os.makedirs(THUMBNAIL_DIR, exist_ok=True)
+            existing_thumbnails = set(os.listdir(THUMBNAIL_DIR))
+        except OSError as e:
+            print(f"Thumbnail error: {e}")
+            existing_thumbnails = None
+        # The same listing tells which videos have thumbnails of older versions lying around
+        self._thumbnail_groups = thumbnails_by_prefix(existing_thumbnails or ())
             
-            for icon_path in standard_icon_paths:
-                if os.path.exists(icon_path):
-                    return QUrl.fromLocalFile(icon_path).toString()
+        batch = []
+        try:
+            # One directory pass; DirEntry.stat() reuses what the scan already fetched
+            with os.scandir(self._directory) as entries:
+                for entry in entries:
+                    # Match the name before is_file(), which may need a stat for some filesystems;
+                    # only the extension is lowered, then looked up in one hash probe. Hidden
+                    # files are skipped, as the glob this scan replaced did
+                    name = entry.name
+                    dot = name.rfind('.')
+                    if dot < 0 or name[0] == '.' or name[dot:].lower() not in VIDEO_EXTS:
+                        continue
+                    # A file deleted or unreadable mid-scan only loses that one video
+                    try:
+                        if not entry.is_file():
+                            continue
+                        batch.append((entry.path, name, entry.stat()))
+                    except OSError as e:
+                        print(f"Error reading {entry.path}: {e}")
+                        continue
+                    if len(batch) >= self.BATCH_SIZE:
+                        self._emit_batch(batch, existing_thumbnails)
+                        batch = []
+        except OSError as e:
+            print(f"Error scanning {self._directory}: {e}")
             
-            # Fallback to empty string if no icon found
-            return ""
+        if batch:
+            self._emit_batch(batch, existing_thumbnails)
             
-        except Exception as e:
-            print(f"Thumbnail error: {e}")
-            # Return an empty string on any error
-            return ""
+    def _emit_batch(self, batch, existing_thumbnails):
+        """Turn a batch of (filepath, name, stat_result) into model columns and report it"""
+        # All the per-video work short of inserting the rows happens here, off the GUI thread
+        paths = [filepath for filepath, _, _ in batch]
+        names = [name for _, name, _ in batch]
+        sizes = array('q', [stat_result.st_size for _, _, stat_result in batch])
+        mtimes = array('q', [int(stat_result.st_mtime) for _, _, stat_result in batch])
+        
+        # A listing of the thumbnail directory saves a stat per video
+        cached_thumbnails = {}
+        for filepath, mtime, size in zip(paths, mtimes, sizes):
+            thumbnail_file = thumbnail_file_for(filepath, mtime, size)
+            thumbnail_name = os.path.basename(thumbnail_file)
+            remove_stale_thumbnails(self._thumbnail_groups.get(thumbnail_prefix_for(filepath), ()), thumbnail_name)
+            if existing_thumbnails is not None:
+                cached = thumbnail_name in existing_thumbnails
+            else:
+                cached = os.path.exists(thumbnail_file)
+            if cached:
+                cached_thumbnails[filepath] = QUrl.fromLocalFile(thumbnail_file).toString()
+                
+        # Formatted once here, so data() hands out the cached strings on every repaint
+        columns = {
+            '_paths': paths,
+            '_names': names,
+            '_name_keys': [name.lower() for name in names],
+            '_sizes': sizes,
+            '_mtimes': mtimes,
+            '_size_texts': [format_size(size) for size in sizes],
+            '_mtime_texts': [datetime.fromtimestamp(mtime).strftime("%Y-%m-%d %H:%M") for mtime in mtimes]
+        }
+        self.signals.batchReady.emit(self._generation, columns, cached_thumbnails)
 
 class VideoGalleryModel(QAbstractListModel):
     FilepathRole = Qt.UserRole + 1
@@ -120,35 +432,99 @@ class VideoGalleryModel(QAbstractListModel):
     LastModifiedRole = Qt.UserRole + 4
     FilesizeFormattedRole = Qt.UserRole + 5
     ThumbnailPathRole = Qt.UserRole + 6
+    LastModifiedFormattedRole = Qt.UserRole + 7
+    
+    # Videos are stored as parallel columns, one entry per row, instead of an
+    # object per video; these are all reordered together when sorting
+    COLUMNS = ('_paths', '_names', '_name_keys', '_sizes', '_mtimes', '_size_texts', '_mtime_texts')
+    
+    # Raw column to sort by for each role; formatted roles sort by the value they
+    # were formatted from
+    SORT_COLUMNS = {
+        FilepathRole: '_paths',
+        FilenameRole: '_name_keys',
+        FilesizeRole: '_sizes',
+        LastModifiedRole: '_mtimes',
+        FilesizeFormattedRole: '_sizes',
+        LastModifiedFormattedRole: '_mtimes'
+    }
+    
+    # Sort column for roles without one of their own
+    DEFAULT_SORT_COLUMN = '_name_keys'
     
-    # Signal when data changes
-    dataChanged = pyqtSignal(QModelIndex, QModelIndex, list)
+    # Queued thumbnails this many rows outside the visible range are dropped
+    THUMBNAIL_CANCEL_DISTANCE = 50
+    
+    statusTextChanged = pyqtSignal()
     
     def __init__(self, parent=None):
         super().__init__(parent)
-        self._videos = []
+        self._paths = []
+        self._names = []
+        # Case-insensitive sort keys of the names, lowered once rather than on every sort
+        self._name_keys = []
+        self._sizes = array('q')
+        self._mtimes = array('q')
+        self._size_texts = []
+        self._mtime_texts = []
+        # Row of each filepath, kept in step with the columns
+        self._rows = {}
+        # Thumbnail URLs by filepath; rows without one show the fallback icon
+        self._thumbnails = {}
+        # Filepaths whose thumbnail is cached, queued or being generated
+        self._requested_thumbnails = set()
+        # Heap of (distance from the viewport centre, sequence, filepath) waiting for a thumbnail
+        self._thumbnail_queue = []
+        self._thumbnail_sequence = 0
+        self._running_thumbnails = 0
+        # Set while a batch is being inserted and _rows lags behind the columns
+        self._inserting_rows = False
+        self._thumbnail_signals = ThumbnailSignals()
+        self._thumbnail_signals.thumbnailReady.connect(self._on_thumbnail_ready)
+        # Filepaths with a new thumbnail and whether the video count changed,
+        # both announced together once the refresh timer fires
+        self._updated_thumbnails = set()
+        self._status_changed = False
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(50)
+        self._refresh_timer.timeout.connect(self._flush_updates)
+        self._directory = ""
+        self._visible_first = 0
+        self._visible_last = 0
+        self._scan_job = None
+        self._scan_generation = 0
+        # Start out sorted by name, like the gallery's sort box
+        self._sort_role = self.FilenameRole
+        self._sort_descending = False
         
     def rowCount(self, parent=QModelIndex()):
-        return len(self._videos)
+        return len(self._paths)
         
     def data(self, index, role=Qt.DisplayRole):
-        if not index.isValid() or index.row() >= len(self._videos):
+        row = index.row()
+        if not index.isValid() or row >= len(self._paths):
             return QVariant()
             
-        video = self._videos[index.row()]
-        
         if role == self.FilepathRole:
-            return video.filepath
+            return self._paths[row]
         elif role == self.FilenameRole:
-            return video.filename
+            return self._names[row]
         elif role == self.FilesizeRole:
-            return video.filesize
+            return self._sizes[row]
         elif role == self.LastModifiedRole:
-            return video.lastModified
+            return QDateTime.fromSecsSinceEpoch(self._mtimes[row])
         elif role == self.FilesizeFormattedRole:
-            return video.fileSizeFormatted
+            return self._size_texts[row]
+        elif role == self.LastModifiedFormattedRole:
+            return self._mtime_texts[row]
         elif role == self.ThumbnailPathRole:
-            return video.thumbnailPath
+            filepath = self._paths[row]
+            # Thumbnails are only generated for rows the view actually shows
+            if filepath not in self._requested_thumbnails:
+                self._requested_thumbnails.add(filepath)
+                self._queue_thumbnail(filepath, row)
+            return self._thumbnails.get(filepath, _FALLBACK_ICON)
             
         return QVariant()
         
@@ -159,43 +535,241 @@ class VideoGalleryModel(QAbstractListModel):
             self.FilesizeRole: b'filesize',
             self.LastModifiedRole: b'lastModified',
             self.FilesizeFormattedRole: b'fileSizeFormatted',
-            self.ThumbnailPathRole: b'thumbnailPath'
+            self.ThumbnailPathRole: b'thumbnailPath',
+            self.LastModifiedFormattedRole: b'lastModifiedFormatted'
         }
         
     @pyqtSlot(str, result=bool)
     def loadVideosFromDirectory(self, directory=None):
-        """Load all video files from the specified directory"""
+        """Start loading the video files of the specified directory in the background"""
         if directory is None:
             directory = os.getcwd()
             
-        # Common video file extensions
-        video_extensions = ['.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.webm', '.m4v', '.3gp', '.mpg', '.mpeg']
-        
         self.beginResetModel()
-        self._videos = []
+        for column in self.COLUMNS:
+            del getattr(self, column)[:]
+        self._rows = {}
+        self._thumbnails = {}
+        self._requested_thumbnails = set()
+        self._thumbnail_queue = []
+        self._updated_thumbnails = set()
+        self._directory = directory
+        self.endResetModel()
+        self.statusTextChanged.emit()
+        
+        # Batches from a scan that is still running for a previous load get ignored
+        self._scan_generation += 1
+        self._scan_job = DirectoryScanJob(directory, self._scan_generation)
+        self._scan_job.signals.batchReady.connect(self._on_batch_ready)
+        QThreadPool.globalInstance().start(self._scan_job)
+        return os.path.isdir(directory)
+        
+    def _on_batch_ready(self, generation, columns, cached_thumbnails):
+        """Merge a batch of scanned videos into place, with one row insertion per run"""
+        if generation != self._scan_generation:
+            return
+            
+        self._thumbnails.update(cached_thumbnails)
+        self._requested_thumbnails.update(cached_thumbnails)
+        
+        # Scandir order is arbitrary, so a sorted batch rarely just continues after
+        # the rows already shown; find where each video goes instead of re-sorting
+        sort_column = self.SORT_COLUMNS.get(self._sort_role, self.DEFAULT_SORT_COLUMN)
+        keys = columns[sort_column]
+        order = sorted(range(len(keys)), key=keys.__getitem__, reverse=self._sort_descending)
+        columns = {name: self._permuted(column, order) for name, column in columns.items()}
         
-        for ext in video_extensions:
-            pattern = os.path.join(directory, f"*{ext}")
-            for filepath in glob.glob(pattern):
-                self._videos.append(VideoInfo(filepath))
+        shown = getattr(self, sort_column)
+        positions = []
+        lo = 0
+        for key in columns[sort_column]:
+            lo = self._insertion_row(shown, key, lo)
+            positions.append(lo)
+            
+        # Runs of the batch landing between the same two shown rows go in together;
+        # inserting from the end keeps the positions of the earlier runs valid
+        runs = []
+        for i, position in enumerate(positions):
+            if runs and runs[-1][0] == position:
+                runs[-1][2] = i + 1
+            else:
+                runs.append([position, i, i + 1])
                 
-        self.endResetModel()
-        return len(self._videos) > 0
+        # Rows are renumbered once all runs are in; thumbnails wait until then
+        self._inserting_rows = True
+        try:
+            for position, batch_first, batch_end in reversed(runs):
+                self.beginInsertRows(QModelIndex(), position, position + batch_end - batch_first - 1)
+                for name in self.COLUMNS:
+                    getattr(self, name)[position:position] = columns[name][batch_first:batch_end]
+                self.endInsertRows()
+        finally:
+            self._inserting_rows = False
+            
+        first = runs[0][0] if runs else len(self._paths)
+        self._rows.update(zip(self._paths[first:], range(first, len(self._paths))))
+        self._status_changed = True
+        self._schedule_refresh()
+        self._start_thumbnail_jobs()
+        
+    def _insertion_row(self, shown, key, lo):
+        """Return the row after every shown row from lo on that sorts before or level with key"""
+        hi = len(shown)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if (key > shown[mid]) if self._sort_descending else (key < shown[mid]):
+                hi = mid
+            else:
+                lo = mid + 1
+        return lo
+        
+    def sortByRole(self, role, descending=False):
+        """Sort the videos in place by the raw value behind the given role"""
+        self._sort_role = role
+        self._sort_descending = descending
+        column = getattr(self, self.SORT_COLUMNS.get(role, self.DEFAULT_SORT_COLUMN))
+        # Sort row numbers by a single column, comparing plain ints and strings
+        # instead of QVariants, then move every column into that order at once
+        order = sorted(range(len(column)), key=column.__getitem__, reverse=descending)
+        
+        self.layoutAboutToBeChanged.emit()
+        self._apply_permutation(order)
+        self._move_persistent_indexes(order)
+        self.layoutChanged.emit()
+        self._reprioritize_thumbnails()
+        
+    def _apply_permutation(self, order):
+        """Reorder every column so that row i holds what was at row order[i]"""
+        for name in self.COLUMNS:
+            setattr(self, name, self._permuted(getattr(self, name), order))
+        self._rows = {filepath: row for row, filepath in enumerate(self._paths)}
+        
+    @staticmethod
+    def _permuted(column, order):
+        """Return a copy of a column, of the same type, in the given row order"""
+        if isinstance(column, array):
+            return array(column.typecode, map(column.__getitem__, order))
+        return [column[i] for i in order]
+        
+    def _move_persistent_indexes(self, order):
+        """Point the view's persistent indexes (current item, selection) at the rows' new positions"""
+        old_indexes = self.persistentIndexList()
+        if not old_indexes:
+            return
+        new_rows = [0] * len(order)
+        for new_row, old_row in enumerate(order):
+            new_rows[old_row] = new_row
+        self.changePersistentIndexList(old_indexes, [self.index(new_rows[index.row()]) for index in old_indexes])
+        
+    def setVisibleRange(self, first, last):
+        """Rank queued thumbnails by their distance from the rows currently on screen"""
+        count = len(self._paths)
+        if count == 0:
+            return
+        self._visible_first = max(0, min(first, count - 1))
+        self._visible_last = max(self._visible_first, min(last, count - 1))
+        self._reprioritize_thumbnails()
+        
+    def _viewport_distance(self, row):
+        return abs(row - (self._visible_first + self._visible_last) // 2)
+        
+    def _queue_thumbnail(self, filepath, row):
+        self._thumbnail_sequence += 1
+        heapq.heappush(self._thumbnail_queue, (self._viewport_distance(row), self._thumbnail_sequence, filepath))
+        self._start_thumbnail_jobs()
+        
+    def _reprioritize_thumbnails(self):
+        """Re-rank the queued thumbnails after the viewport or the order changed"""
+        if not self._thumbnail_queue:
+            return
+            
+        queue = []
+        for _, sequence, filepath in self._thumbnail_queue:
+            row = self._rows.get(filepath)
+            if row is None:
+                continue
+            # Rows scrolled far away are requested again if they come back into view
+            if (row < self._visible_first - self.THUMBNAIL_CANCEL_DISTANCE
+                    or row > self._visible_last + self.THUMBNAIL_CANCEL_DISTANCE):
+                self._requested_thumbnails.discard(filepath)
+                continue
+            queue.append((self._viewport_distance(row), sequence, filepath))
+            
+        heapq.heapify(queue)
+        self._thumbnail_queue = queue
+        
+    def _start_thumbnail_jobs(self):
+        """Start the queued thumbnails closest to the viewport while the pool has room"""
+        if self._inserting_rows:
+            return
+        while self._thumbnail_queue and self._running_thumbnails < _THUMBNAIL_POOL.maxThreadCount():
+            _, _, filepath = heapq.heappop(self._thumbnail_queue)
+            row = self._rows.get(filepath)
+            if row is None:
+                continue
+            self._running_thumbnails += 1
+            thumbnail_file = thumbnail_file_for(filepath, self._mtimes[row], self._sizes[row])
+            _THUMBNAIL_POOL.start(ThumbnailJob(filepath, thumbnail_file, self._thumbnail_signals))
+        
+    @pyqtSlot(str, str)
+    def _on_thumbnail_ready(self, filepath, thumbnail_path):
+        """Refresh the row of a video whose thumbnail finished generating"""
+        self._running_thumbnails -= 1
+        self._start_thumbnail_jobs()
+        
+        row = self._rows.get(filepath)
+        if row is None:
+            # The directory was reloaded while the thumbnail was being generated
+            return
+        self._thumbnails[filepath] = thumbnail_path
+        self._updated_thumbnails.add(filepath)
+        self._schedule_refresh()
+        
+    @pyqtProperty(str, notify=statusTextChanged)
+    def statusText(self):
+        return f"{len(self._paths)} videos found in {self._directory}"
+        
+    def _schedule_refresh(self):
+        if not self._refresh_timer.isActive():
+            self._refresh_timer.start()
+            
+    def _flush_updates(self):
+        """Announce the changes collected since the refresh timer was started"""
+        if self._status_changed:
+            self._status_changed = False
+            self.statusTextChanged.emit()
+        self._refresh_thumbnail_rows()
+        
+    def _refresh_thumbnail_rows(self):
+        """Emit one dataChanged per run of consecutive rows whose thumbnail changed"""
+        # Rows are looked up only now, since a sort may have moved them meanwhile
+        rows = sorted(self._rows[filepath] for filepath in self._updated_thumbnails if filepath in self._rows)
+        self._updated_thumbnails = set()
+        
+        start = 0
+        for i in range(1, len(rows) + 1):
+            if i == len(rows) or rows[i] != rows[i - 1] + 1:
+                self.dataChanged.emit(self.index(rows[start]), self.index(rows[i - 1]), [self.ThumbnailPathRole])
+                start = i
 
 class VideoGallery(QObject):
     videoSelected = pyqtSignal(str)
     modelChanged = pyqtSignal()
+    statusTextChanged = pyqtSignal()
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self._model = VideoGalleryModel()
-        self._proxy_model = QSortFilterProxyModel()
-        self._proxy_model.setSourceModel(self._model)
+        self._model.statusTextChanged.connect(self.statusTextChanged)
         self._script_path = os.path.abspath(sys.argv[0])
         
     @pyqtProperty(QObject, notify=modelChanged)
     def model(self):
-        return self._proxy_model
+        return self._model
+        
+    @pyqtProperty(str, notify=statusTextChanged)
+    def statusText(self):
+        return self._model.statusText
         
     @pyqtProperty(str, constant=True)
     def scriptPath(self):
@@ -203,31 +777,15 @@ class VideoGallery(QObject):
         
     @pyqtSlot(str)
     def openVideoInTrimmer(self, filepath):
-        """Launch the video in the trimmer using subprocess"""
-        try:
-            print(f"Opening video in trimmer: {filepath}")
-            
-            # Get the Python executable and script path
-            python_exe = sys.executable
-            script_path = self._script_path
-            
-            # Use subprocess to properly launch with arguments
-            import subprocess
-            
-            # Launch in a new process and detach
-            if sys.platform == 'win32':
-                # Windows uses different creation flags
-                subprocess.Popen([python_exe, script_path, filepath], 
-                                 creationflags=subprocess.CREATE_NEW_PROCESS_GROUP)
-            else:
-                # Linux/macOS
-                subprocess.Popen([python_exe, script_path, filepath], 
-                                 start_new_session=True)
-                
-            # Signal the application to close
-            QTimer.singleShot(500, lambda: QGuiApplication.instance().quit())
-        except Exception as e:
-            print(f"Error launching trimmer: {e}")
+        """Launch the video in the trimmer as a detached process"""
+        print(f"Opening video in trimmer: {filepath}")
+        
+        # Qt spawns the process fully detached and returns right away, so the
+        # gallery can close on the next event loop pass instead of after a delay
+        if not QProcess.startDetached(sys.executable, [self._script_path, filepath]):
+            print(f"Error launching trimmer for {filepath}")
+            return
+        QTimer.singleShot(0, QGuiApplication.instance().quit)
         
     @pyqtSlot(str, result=bool)
     def loadFromDirectory(self, directory=None):
@@ -235,6 +793,11 @@ class VideoGallery(QObject):
         self.modelChanged.emit()
         return result
         
+    @pyqtSlot(int, int)
+    def setVisibleRange(self, first, last):
+        """Let the model generate thumbnails for the rows on screen first"""
+        self._model.setVisibleRange(first, last)
+        
     @pyqtSlot(str)
     def selectVideo(self, filepath):
         self.videoSelected.emit(filepath)
@@ -242,15 +805,13 @@ class VideoGallery(QObject):
     @pyqtSlot(int)
     def sortBy(self, role):
         """Sort the model by the specified role"""
-        self._proxy_model.setSortRole(role)
-        self._proxy_model.sort(0, Qt.AscendingOrder)
+        self._model.sortByRole(role)
         self.modelChanged.emit()
         
     @pyqtSlot(int)
     def sortByDescending(self, role):
         """Sort the model by the specified role in descending order"""
-        self._proxy_model.setSortRole(role)
-        self._proxy_model.sort(0, Qt.DescendingOrder)
+        self._model.sortByRole(role, descending=True)
         self.modelChanged.emit()
     
     @pyqtProperty(int, constant=True)
@@ -285,9 +846,13 @@ class VideoTrimmer(QObject):
         self._end_time = 0
         self._duration = 0
         self._video_path = ""
+        self._source_info = {}  # ffprobe format info of the loaded video
         self._trim_completed = False
         self._temp_output = None
         self._compressed_output = None
+        self._compression_job = None
+        # Numbers the compressions, so each one writes a file of its own
+        self._compression_count = 0
         self._max_size_mb = 50  # Maximum size for compressed videos in MB
 
     @pyqtProperty(int, notify=startTimeChanged)
@@ -330,6 +895,7 @@ class VideoTrimmer(QObject):
             self._video_path = os.path.abspath(self._video_path)
             
         print(f"Setting video file: {self._video_path}")
+        self._source_info = {}
         
         try:
             # Check if file exists
@@ -337,22 +903,14 @@ class VideoTrimmer(QObject):
                 self.errorOccurred.emit(f"File not found: {self._video_path}")
                 return
                 
-            # Get video duration using ffprobe
-            cmd = [
-                'ffprobe', 
-                '-v', 'error', 
-                '-show_entries', 'format=duration', 
-                '-of', 'default=noprint_wrappers=1:nokey=1', 
-                self._video_path
-            ]
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            
-            if result.returncode == 0:
-                self._duration = int(float(result.stdout.strip()) * 1000)  # Convert to milliseconds
-                self._end_time = self._duration
-                self.durationChanged.emit()
-            else:
-                self.errorOccurred.emit(f"Error getting video duration: {result.stderr}")
+            # One ffprobe gives both the duration and the bit rate used to
+            # project trim sizes later
+            self._source_info = probe_format(self._video_path)
+            self._duration = self._source_info['duration']
+            self._end_time = self._duration
+            self.durationChanged.emit()
+        except subprocess.CalledProcessError as e:
+            self.errorOccurred.emit(f"Error getting video duration: {e.stderr}")
         except Exception as e:
             self.errorOccurred.emit(f"Error processing video: {str(e)}")
 
@@ -364,6 +922,13 @@ class VideoTrimmer(QObject):
             return False
             
         try:
+            # A compression still running belongs to the previous trim; its result is
+            # dropped when it lands
+            if self._compression_job is not None:
+                self._compression_job = None
+                self.compressionFinished.emit()
+            self._discard_compressed_output()
+            
             # Get temp directory for storing the trimmed video temporarily
             self._temp_output = os.path.join(tempfile.gettempdir(), f"trimmed_video_{os.getpid()}.mp4")
             
@@ -371,23 +936,35 @@ class VideoTrimmer(QObject):
             start_seconds = self._start_time / 1000
             duration_seconds = (self._end_time - self._start_time) / 1000
             
+            # If the trim is going to be over the size limit anyway, trim and compress
+            # in a single ffmpeg pass instead of stream-copying first; it runs on the
+            # ffmpeg pool so the UI stays responsive and shows the progress
+            estimated_size_mb = self._estimated_size_mb()
+            if estimated_size_mb > self._max_size_mb:
+                self._trim_completed = True
+                self.trimCompleteChanged.emit(f"Compressing video ({self._max_size_mb}MB max)...")
+                self._start_compression(self._target_bitrate(self._max_size_mb), estimated_size_mb, None)
+                return True
+            
             cmd = [
-                'ffmpeg',
-                '-y',  # Overwrite output file if it exists
-                '-i', self._video_path,
+                *FFMPEG_ARGS,
+                # Seek in the demuxer before opening the input, rather than reading
+                # everything up to the start point
                 '-ss', str(start_seconds),
+                '-i', self._video_path,
                 '-t', str(duration_seconds),
                 '-c', 'copy',  # Use stream copy for fast trimming without re-encoding
+                '-avoid_negative_ts', 'make_zero',  # Start the copied timestamps at zero for players
                 self._temp_output
             ]
             
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = run_ffmpeg(cmd)
             
             if result.returncode == 0:
                 self._trim_completed = True
-                # Generate compressed version if needed
-                QTimer.singleShot(100, self._check_and_compress)
-                self.trimCompleteChanged.emit("Trim created and ready to save or copy")
+                # The size projection already ruled out compression for most trims, so
+                # settle it right away with a single stat instead of a timer round trip
+                self._check_and_compress()
                 return True
             else:
                 self.errorOccurred.emit(f"Error trimming video: {result.stderr}")
@@ -397,15 +974,138 @@ class VideoTrimmer(QObject):
             self.errorOccurred.emit(f"Error during trimming: {str(e)}")
             return False
             
+    def _estimated_size_mb(self):
+        """Estimate the size of the trim in MB from the source bit rate, or 0 if unknown"""
+        bit_rate = self._source_info.get('bit_rate', 0)
+        duration_seconds = (self._end_time - self._start_time) / 1000
+        return (bit_rate * duration_seconds) / 8 / (1024 * 1024)
+        
+    def _target_bitrate(self, size_mb):
+        """Calculate the video bitrate needed for the trim to fit in size_mb"""
+        duration_seconds = (self._end_time - self._start_time) / 1000
+        # The budget is shared with the audio track, whose size grows with the
+        # duration; 5% is kept back for the container and rate control overshoot
+        budget_bits = size_mb * 1024 * 1024 * 8 * 0.95 - AUDIO_BITRATE * duration_seconds
+        # Long trims at small sizes leave almost nothing for the video; keep it
+        # watchable rather than asking the encoder for a zero or negative rate
+        return max(MIN_VIDEO_BITRATE, int(budget_bits / duration_seconds))
+        
+    def _fused_trim_and_compress(self, source_path, start_seconds, duration_seconds, target_bitrate, output_path):
+        """Trim the source video and re-encode it to the target bitrate in one ffmpeg pass"""
+        # Runs on the ffmpeg pool, so it only uses what it was given and never the
+        # trimmer's state, which the GUI thread may have changed since
+        bounds = self._segment_bounds(source_path, start_seconds, start_seconds + duration_seconds)
+        if bounds:
+            return self._segmented_trim_and_compress(source_path, bounds, target_bitrate, output_path)
+            
+        cmd = self._encode_command(source_path, start_seconds, duration_seconds, target_bitrate, output_path)
+        return run_ffmpeg_with_progress(cmd, duration_seconds, self.compressionProgressChanged.emit)
+        
+    def _encode_command(self, source_path, start_seconds, duration_seconds, target_bitrate, output_path,
+                        threads='auto', audio=True):
+        """Build the ffmpeg command re-encoding a range of the source to the target bitrate"""
+        encoder = video_encoder()
+        audio_args = ['-c:a', 'aac', '-b:a', f"{AUDIO_BITRATE}"] if audio else ['-an']
+        return [
+            *FFMPEG_ARGS,
+            *encoder_input_args(encoder),
+            '-ss', str(start_seconds),
+            '-t', str(duration_seconds),
+            '-threads', '0',  # Decode with as many threads as ffmpeg sees fit
+            '-i', source_path,
+            *encoder_output_args(encoder, target_bitrate, threads),
+            *audio_args,
+            '-movflags', '+faststart',  # Put the moov atom first so the file streams
+            output_path
+        ]
+        
+    def _segment_bounds(self, source_path, start_seconds, end_seconds):
+        """Split a long range at keyframes for parallel encoding, or return None to encode it whole"""
+        # Hardware encoders don't scale with cores, and consumer GPUs cap concurrent sessions
+        segment_count = (os.cpu_count() or 1) // SEGMENT_THREADS
+        if (segment_count < 2 or end_seconds - start_seconds < SEGMENT_MIN_SECONDS
+                or video_encoder() != 'libx264'):
+            return None
+            
+        try:
+            keyframes = probe_keyframes(source_path, start_seconds, end_seconds)
+        except Exception:
+            return None
+            
+        # Cut at the keyframe closest to each even split point, so no segment has to
+        # decode frames that belong to its neighbour
+        bounds = [start_seconds]
+        for i in range(1, segment_count):
+            split_point = start_seconds + (end_seconds - start_seconds) * i / segment_count
+            keyframe = min(keyframes, key=lambda time: abs(time - split_point), default=None)
+            if keyframe is not None and keyframe > bounds[-1] + 1 and keyframe < end_seconds - 1:
+                bounds.append(keyframe)
+        bounds.append(end_seconds)
+        return bounds if len(bounds) > 2 else None
+        
+    def _segmented_trim_and_compress(self, source_path, bounds, target_bitrate, output_path):
+        """Encode the segments between bounds in parallel, then join them and add the audio"""
+        durations = [end - start for start, end in zip(bounds, bounds[1:])]
+        percents = [0] * len(durations)
+        
+        def on_segment_progress(index, percent):
+            percents[index] = percent
+            done = sum(segment_percent * duration for segment_percent, duration in zip(percents, durations))
+            self.compressionProgressChanged.emit(int(done / sum(durations)))
+            
+        with tempfile.TemporaryDirectory(prefix="otrimmer_") as work_dir:
+            segment_paths = [os.path.join(work_dir, f"segment_{index}.mp4") for index in range(len(durations))]
+            
+            def encode_segment(index):
+                # Video only: AAC frames don't line up with the cuts, so per-segment audio
+                # would leave priming gaps and drift at every join
+                cmd = self._encode_command(source_path, bounds[index], durations[index], target_bitrate,
+                                           segment_paths[index], threads=SEGMENT_THREADS, audio=False)
+                return run_ffmpeg_with_progress(cmd, durations[index], partial(on_segment_progress, index))
+                
+            # ffmpeg does the work in its own processes, so threads are enough to drive them
+            with concurrent.futures.ThreadPoolExecutor(max_workers=len(durations)) as pool:
+                results = list(pool.map(encode_segment, range(len(durations))))
+            failed = next((result for result in results if result.returncode != 0), None)
+            if failed is not None:
+                return failed
+                
+            # Every segment starts on a fresh keyframe with the same settings, so the
+            # concat demuxer can join the video with a plain stream copy
+            list_path = os.path.join(work_dir, "segments.txt")
+            with open(list_path, 'w') as segment_list:
+                for segment_path in segment_paths:
+                    escaped_path = segment_path.replace("'", "'\\''")
+                    segment_list.write(f"file '{escaped_path}'\n")
+                    
+            cmd = [
+                *FFMPEG_ARGS,
+                '-f', 'concat',
+                '-safe', '0',
+                '-i', list_path,
+                # The audio is encoded once, in one piece, from the same range of the source
+                '-ss', str(bounds[0]),
+                '-t', str(bounds[-1] - bounds[0]),
+                '-i', source_path,
+                '-map', '0:v',
+                '-map', '1:a?',
+                '-c:v', 'copy',
+                '-c:a', 'aac',
+                '-b:a', f"{AUDIO_BITRATE}",
+                '-movflags', '+faststart',
+                output_path
+            ]
+            return run_ffmpeg(cmd)
+        
     def _check_and_compress(self):
         """Check if the trimmed video needs compression and compress it if necessary"""
         try:
-            if not os.path.exists(self._temp_output):
+            stat_result = stat_or_none(self._temp_output)
+            if stat_result is None:
                 return
                 
             # Check file size
-            file_size_bytes = os.path.getsize(self._temp_output)
-            file_size_mb = file_size_bytes / (1024 * 1024)
+            file_size_mb = stat_result.st_size / (1024 * 1024)
             
             if file_size_mb <= self._max_size_mb:
                 # File is already small enough
@@ -415,68 +1115,84 @@ class VideoTrimmer(QObject):
                 
             # Need to compress
             self.trimCompleteChanged.emit(f"Compressing video ({file_size_mb:.1f}MB → {self._max_size_mb}MB max)...")
-            self._compressed_output = os.path.join(tempfile.gettempdir(), f"compressed_video_{os.getpid()}.mp4")
             
-            # Calculate target bitrate to achieve desired file size
-            # Formula: bitrate = target_size_bytes * 8 / duration_seconds
-            video_info = self._get_video_info(self._temp_output)
-            duration_seconds = float(video_info.get('duration', 0))
+            # The stream-copied trim keeps the selected range, so no need to re-probe it
+            duration_seconds = (self._end_time - self._start_time) / 1000
             if duration_seconds <= 0:
                 self.errorOccurred.emit("Could not determine video duration for compression")
                 return
                 
-            target_size_bytes = self._max_size_mb * 1024 * 1024 * 0.95  # 5% buffer
-            target_bitrate = int((target_size_bytes * 8) / duration_seconds)
-            
-            # Compress video
-            cmd = [
-                'ffmpeg',
-                '-y',
-                '-i', self._temp_output,
-                '-c:v', 'libx264',
-                '-b:v', f"{target_bitrate}",
-                '-preset', 'medium',  # Balance between speed and compression
-                '-c:a', 'aac',
-                '-b:a', '128k',
-                self._compressed_output
-            ]
-            
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            # Re-encode straight from the source rather than from the stream-copied trim
+            return self._start_compression(self._target_bitrate(self._max_size_mb), file_size_mb, self._temp_output)
+        except Exception as e:
+            self.errorOccurred.emit(f"Error during compression: {str(e)}")
+            self._compressed_output = self._temp_output  # Fallback to uncompressed
             
+    def _start_compression(self, target_bitrate, file_size_mb, fallback_output):
+        """Run the compression on the ffmpeg pool, returning its job"""
+        self._discard_compressed_output()
+        
+        # A fresh file per job, so a job that outlives its trim can't overwrite the next one
+        self._compression_count += 1
+        output_path = os.path.join(tempfile.gettempdir(), f"compressed_video_{os.getpid()}_{self._compression_count}.mp4")
+        self._compressed_output = output_path
+        
+        # The range is fixed now, matching the bitrate it was computed for; the
+        # handles may move before the pool gets round to the job
+        start_seconds = self._start_time / 1000
+        duration_seconds = (self._end_time - self._start_time) / 1000
+        
+        self.compressionStarted.emit()
+        job = CompressionJob(partial(self._fused_trim_and_compress, self._video_path, start_seconds,
+                                     duration_seconds, target_bitrate, output_path))
+        job.signals.finished.connect(partial(self._on_compress_done, job, output_path, file_size_mb, fallback_output))
+        self._compression_job = job
+        _FFMPEG_POOL.start(job)
+        return job
+        
+    def _discard_compressed_output(self):
+        """Delete the file of a previous compression, keeping the stream-copied trim"""
+        if self._compressed_output not in (None, self._temp_output):
+            try:
+                os.remove(self._compressed_output)
+            except OSError:
+                pass
+        self._compressed_output = None
+        
+    def _on_compress_done(self, job, output_path, file_size_mb, fallback_output, result):
+        """Report the result of a background compression"""
+        if job is not self._compression_job:
+            # Superseded by a newer trim; its output is of no use to anyone
+            try:
+                os.remove(output_path)
+            except OSError:
+                pass
+            return
+        self._compression_job = None
+        
+        try:
+            if isinstance(result, Exception):
+                raise result
             if result.returncode == 0:
-                compressed_size_mb = os.path.getsize(self._compressed_output) / (1024 * 1024)
+                self._compressed_output = output_path
+                compressed_size_mb = os.path.getsize(output_path) / (1024 * 1024)
                 self.trimCompleteChanged.emit(f"Compressed video ({file_size_mb:.1f}MB → {compressed_size_mb:.1f}MB)")
             else:
                 self.errorOccurred.emit(f"Error compressing video: {result.stderr}")
-                self._compressed_output = self._temp_output  # Fallback to uncompressed
+                self._fall_back_to(fallback_output)
         except Exception as e:
             self.errorOccurred.emit(f"Error during compression: {str(e)}")
-            self._compressed_output = self._temp_output  # Fallback to uncompressed
-            
-    def _get_video_info(self, video_path):
-        """Get video information using ffprobe"""
-        try:
-            cmd = [
-                'ffprobe',
-                '-v', 'error',
-                '-select_streams', 'v:0',
-                '-show_entries', 'format=duration',
-                '-of', 'json',
-                video_path
-            ]
+            self._fall_back_to(fallback_output)
+        finally:
+            self.compressionFinished.emit()
             
-            result = subprocess.run(cmd, capture_output=True, text=True)
+    def _fall_back_to(self, fallback_output):
+        """Use the uncompressed trim after a failed compression, if there is one"""
+        self._compressed_output = fallback_output
+        if fallback_output is None:
+            # A fused trim-and-compress leaves nothing usable behind
+            self._trim_completed = False
             
-            if result.returncode == 0:
-                import json
-                data = json.loads(result.stdout)
-                return {
-                    'duration': data.get('format', {}).get('duration', 0)
-                }
-            return {}
-        except Exception:
-            return {}
-    
     @pyqtSlot(int, result=bool)
     def compressToSize(self, size_mb):
         """Compress the trimmed video to a specific size in MB"""
@@ -488,16 +1204,13 @@ class VideoTrimmer(QObject):
             # Use the output of the trimming operation as the input for compression
             input_file = self._temp_output
             
-            if not os.path.exists(input_file):
+            stat_result = stat_or_none(input_file)
+            if stat_result is None:
                 self.errorOccurred.emit("Trimmed video file not found")
                 return False
                 
-            # Create a new output file for the compressed version
-            self._compressed_output = os.path.join(tempfile.gettempdir(), f"compressed_video_{os.getpid()}.mp4")
-            
             # Check file size
-            file_size_bytes = os.path.getsize(input_file)
-            file_size_mb = file_size_bytes / (1024 * 1024)
+            file_size_mb = stat_result.st_size / (1024 * 1024)
             
             if file_size_mb <= size_mb:
                 # File is already small enough
@@ -505,46 +1218,20 @@ class VideoTrimmer(QObject):
                 self.trimCompleteChanged.emit(f"Video already fits size requirement ({file_size_mb:.1f}MB)")
                 return True
                 
-            # Notify compression started
-            self.compressionStarted.emit()
-            self.trimCompleteChanged.emit(f"Compressing video ({file_size_mb:.1f}MB → {size_mb}MB)...")
-            
-            # Calculate target bitrate to achieve desired file size
-            # Formula: bitrate = target_size_bytes * 8 / duration_seconds
-            video_info = self._get_video_info(input_file)
-            duration_seconds = float(video_info.get('duration', 0))
+            # The trim covers the selected range, so its duration is already known
+            duration_seconds = (self._end_time - self._start_time) / 1000
             if duration_seconds <= 0:
                 self.errorOccurred.emit("Could not determine video duration for compression")
-                return False
-                
-            target_size_bytes = size_mb * 1024 * 1024 * 0.95  # 5% buffer
-            target_bitrate = int((target_size_bytes * 8) / duration_seconds)
-            
-            # Compress video
-            cmd = [
-                'ffmpeg',
-                '-y',
-                '-i', input_file,
-                '-c:v', 'libx264',
-                '-b:v', f"{target_bitrate}",
-                '-preset', 'medium',  # Balance between speed and compression
-                '-c:a', 'aac',
-                '-b:a', '128k',
-                self._compressed_output
-            ]
-            
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            
-            if result.returncode == 0:
-                compressed_size_mb = os.path.getsize(self._compressed_output) / (1024 * 1024)
-                self.trimCompleteChanged.emit(f"Compressed video ({file_size_mb:.1f}MB → {compressed_size_mb:.1f}MB)")
-                self.compressionFinished.emit()
-                return True
-            else:
-                self.errorOccurred.emit(f"Error compressing video: {result.stderr}")
                 self._compressed_output = input_file  # Fallback to uncompressed
                 self.compressionFinished.emit()
                 return False
+                
+            self.trimCompleteChanged.emit(f"Compressing video ({file_size_mb:.1f}MB → {size_mb}MB)...")
+            
+            # Compress video straight from the source range, so a trim that createTrim
+            # already compressed does not get encoded twice
+            self._start_compression(self._target_bitrate(size_mb), file_size_mb, input_file)
+            return True
         
         except Exception as e:
             self.errorOccurred.emit(f"Error during compression: {str(e)}")
@@ -563,15 +1250,15 @@ class VideoTrimmer(QObject):
             # Use the compressed version if available, otherwise use the trimmed version
             file_to_copy = self._compressed_output if self._compressed_output else self._temp_output
             
-            if not os.path.exists(file_to_copy):
+            stat_result = stat_or_none(file_to_copy)
+            if stat_result is None:
                 self.errorOccurred.emit("Trimmed video file not found")
                 return False
             
-            # Schedule the clipboard operation to run asynchronously
-            QTimer.singleShot(100, lambda: self._copy_file_path_to_clipboard(file_to_copy))
+            self._copy_file_path_to_clipboard(file_to_copy)
             
             # Get file size for display
-            file_size_mb = os.path.getsize(file_to_copy) / (1024 * 1024)
+            file_size_mb = stat_result.st_size / (1024 * 1024)
             self.trimCompleteChanged.emit(f"Video copied to clipboard ({file_size_mb:.1f}MB)")
             return True
         except Exception as e:
@@ -579,21 +1266,18 @@ class VideoTrimmer(QObject):
             return False
     
     def _copy_file_path_to_clipboard(self, file_path):
-        """Copy the file path to clipboard for file drops"""
+        """Copy the file to the clipboard for file drops, and its path to the primary selection"""
         try:
-            # Check if wl-copy is available (for Wayland)
-            if not shutil.which("wl-copy"):
-                self.errorOccurred.emit("wl-clipboard not installed. Install with: sudo pacman -S wl-clipboard")
-                return
-                
-            # Copy the file itself, not just its name
-            # Use -t option to set the MIME type as text/uri-list for file paths
-            cmd = ['wl-copy', '-t', 'text/uri-list', f"file://{file_path}"]
-            subprocess.run(cmd, timeout=2)
+            # Qt talks to the compositor directly, no need for wl-copy processes
+            clipboard = QGuiApplication.clipboard()
+            
+            # Offer the file itself (text/uri-list), not just its name
+            mime_data = QMimeData()
+            mime_data.setUrls([QUrl.fromLocalFile(file_path)])
+            clipboard.setMimeData(mime_data)
             
             # Also copy the file path as plain text as a fallback
-            cmd = ['wl-copy', '-p', file_path]  # -p for primary selection
-            subprocess.run(cmd, timeout=2)
+            clipboard.setText(file_path, QClipboard.Selection)
             
         except Exception as e:
             self.errorOccurred.emit(f"Clipboard operation error: {str(e)}")
@@ -609,7 +1293,8 @@ class VideoTrimmer(QObject):
             # Use the compressed version if available, otherwise use the trimmed version
             file_to_save = self._compressed_output if self._compressed_output else self._temp_output
             
-            if not os.path.exists(file_to_save):
+            stat_result = stat_or_none(file_to_save)
+            if stat_result is None:
                 self.errorOccurred.emit("Trimmed video file not found")
                 return False
                 
@@ -630,10 +1315,10 @@ class VideoTrimmer(QObject):
             if result.returncode == 0 and result.stdout.strip():
                 # Copy the file to the selected location
                 output_path = result.stdout.strip()
-                shutil.copy2(file_to_save, output_path)
+                copy_file(file_to_save, output_path)
                 
                 # Get file size for display
-                file_size_mb = os.path.getsize(file_to_save) / (1024 * 1024)
+                file_size_mb = stat_result.st_size / (1024 * 1024)
                 self.trimCompleteChanged.emit(f"Saved to: {output_path} ({file_size_mb:.1f}MB)")
                 return True
             else:
@@ -710,13 +1395,9 @@ def main():
     qml_file = None
     if args.gallery:
         qml_file = os.path.join(qml_root_path, "gallery.qml")
-        # Fall back to the embedded resource if the file doesn't exist
+        # Fall back to the copy shipped next to the script if the file doesn't exist
         if not os.path.exists(qml_file):
-            # Create the gallery QML file if it doesn't exist
-            gallery_qml_content = GALLERY_QML_CONTENT
-            os.makedirs(os.path.dirname(qml_file), exist_ok=True)
-            with open(qml_file, 'w') as f:
-                f.write(gallery_qml_content)
+            qml_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), "gallery.qml")
     else:
         qml_file = os.path.join(qml_root_path, "otrimmer.qml")
         # Fall back to the embedded resource if the file doesn't exist
@@ -770,377 +1451,5 @@ def main():
     
     sys.exit(app.exec_())
 
-# Gallery QML template - will be saved to disk if not found
-GALLERY_QML_CONTENT = """import QtQuick 2.15
-import QtQuick.Controls 2.15 as Controls
-import QtQuick.Layouts 1.15
-import org.kde.kirigami 2.19 as Kirigami
-import QtQuick.Window 2.15
-import Trimmer 1.0
-
-Kirigami.ApplicationWindow {
-    id: root
-    width: 900
-    height: 600
-    title: "OTrimmer Gallery"
-    
-    // Gallery model
-    VideoGallery {
-        id: gallery
-        
-        Component.onCompleted: {
-            loadFromDirectory(initialDirectory)
-        }
-        
-        onVideoSelected: function(filepath) {
-            console.log("Video selected: " + filepath);
-            
-            // Let the Python backend handle launching the video trimmer
-            gallery.openVideoInTrimmer(filepath);
-            
-            // Note: The Python side will handle quitting after launching the new process
-        }
-    }
-    
-    // Global theme settings
-    pageStack.globalToolBar.style: Kirigami.ApplicationHeaderStyle.None
-    pageStack.defaultColumnWidth: root.width
-    
-    // Notifications
-    Kirigami.InlineMessage {
-        id: errorNotification
-        visible: false
-        type: Kirigami.MessageType.Error
-        text: ""
-        anchors {
-            top: parent.top
-            left: parent.left
-            right: parent.right
-            margins: Kirigami.Units.largeSpacing
-        }
-        z: 999
-    }
-    
-    // Main page
-    pageStack.initialPage: Kirigami.Page {
-        padding: 0
-        
-        ColumnLayout {
-            anchors.fill: parent
-            spacing: 0
-            
-            // Toolbar
-            Rectangle {
-                Layout.fillWidth: true
-                Layout.preferredHeight: toolbarLayout.height + Kirigami.Units.largeSpacing * 2
-                color: Kirigami.Theme.highlightColor
-                
-                RowLayout {
-                    id: toolbarLayout
-                    anchors {
-                        left: parent.left
-                        right: parent.right
-                        top: parent.top
-                        margins: Kirigami.Units.largeSpacing
-                    }
-                    
-                    Kirigami.Heading {
-                        level: 1
-                        text: "Video Gallery"
-                        color: Kirigami.Theme.highlightedTextColor
-                    }
-                    
-                    Item { Layout.fillWidth: true }
-                    
-                    Controls.ComboBox {
-                        id: sortComboBox
-                        model: ["Name", "Size", "Date Modified"]
-                        
-                        onActivated: {
-                            switch (currentIndex) {
-                                case 0: // Name
-                                    if (sortOrderToggle.checked) {
-                                        gallery.sortByDescending(gallery.filenameRole)
-                                    } else {
-                                        gallery.sortBy(gallery.filenameRole)
-                                    }
-                                    break
-                                case 1: // Size
-                                    if (sortOrderToggle.checked) {
-                                        gallery.sortByDescending(gallery.filesizeRole)
-                                    } else {
-                                        gallery.sortBy(gallery.filesizeRole)
-                                    }
-                                    break
-                                case 2: // Date Modified
-                                    if (sortOrderToggle.checked) {
-                                        gallery.sortByDescending(gallery.lastModifiedRole)
-                                    } else {
-                                        gallery.sortBy(gallery.lastModifiedRole)
-                                    }
-                                    break
-                            }
-                        }
-                    }
-                    
-                    Controls.ToolButton {
-                        id: sortOrderToggle
-                        icon.name: checked ? "sort-name-descending" : "sort-name-ascending"
-                        checkable: true
-                        
-                        onToggled: {
-                            // Re-sort based on current combo box selection
-                            sortComboBox.activated(sortComboBox.currentIndex)
-                        }
-                    }
-                    
-                    Controls.Slider {
-                        id: thumbnailSizeSlider
-                        from: 120
-                        to: 240
-                        stepSize: 20
-                        value: 160
-                        Layout.preferredWidth: 100
-                    }
-                }
-            }
-            
-            // Gallery view - Grid Layout
-            Controls.ScrollView {
-                Layout.fillWidth: true
-                Layout.fillHeight: true
-                
-                GridView {
-                    id: galleryGrid
-                    model: gallery.model
-                    
-                    // Force model to be evaluated only after it's ready
-                    Component.onCompleted: {
-                        // This ensures the model is properly processed
-                        console.log("Grid view initialized with " + count + " items")
-                    }
-                    cellWidth: thumbnailSizeSlider.value + Kirigami.Units.largeSpacing
-                    cellHeight: thumbnailSizeSlider.value + 40 // Extra space for caption
-                    
-                    delegate: Item {
-                        width: galleryGrid.cellWidth
-                        height: galleryGrid.cellHeight
-                        
-                        // Thumbnail container with hover effect
-                        Rectangle {
-                            id: thumbnailContainer
-                            anchors.centerIn: parent
-                            width: thumbnailSizeSlider.value
-                            height: thumbnailSizeSlider.value
-                            color: "black"
-                            border.width: mouseArea.containsMouse ? 3 : 1
-                            border.color: mouseArea.containsMouse ? Kirigami.Theme.highlightColor : Kirigami.Theme.disabledTextColor
-                            radius: 5
-                            
-                            // Video thumbnail
-                            Image {
-                                id: thumbnail
-                                anchors.fill: parent
-                                anchors.margins: 2
-                                source: model.thumbnailPath || "qrc:///icons/video-x-generic"
-                                fillMode: Image.PreserveAspectCrop
-                                asynchronous: true
-                                cache: true
-                                
-                                // Placeholder while loading
-                                Rectangle {
-                                    anchors.fill: parent
-                                    color: Kirigami.Theme.backgroundColor
-                                    visible: thumbnail.status !== Image.Ready
-                                    
-                                    Kirigami.Icon {
-                                        anchors.centerIn: parent
-                                        source: "video-x-generic"
-                                        width: 48
-                                        height: 48
-                                    }
-                                }
-                                
-                                // Play icon overlay
-                                Kirigami.Icon {
-                                    anchors.centerIn: parent
-                                    source: "media-playback-start"
-                                    width: 32
-                                    height: 32
-                                    color: "white"
-                                    opacity: mouseArea.containsMouse ? 1.0 : 0.7
-                                    visible: mouseArea.containsMouse
-                                }
-                            }
-                            
-                            // File size indicator
-                            Rectangle {
-                                anchors.right: parent.right
-                                anchors.bottom: parent.bottom
-                                anchors.margins: 4
-                                width: sizeLabel.width + 10
-                                height: sizeLabel.height + 6
-                                color: "#80000000"
-                                radius: 3
-                                
-                                Controls.Label {
-                                    id: sizeLabel
-                                    anchors.centerIn: parent
-                                    text: model.fileSizeFormatted
-                                    color: "white"
-                                    font.pointSize: 8
-                                }
-                            }
-                        }
-                        
-                        // Filename below thumbnail
-                        Controls.Label {
-                            anchors.top: thumbnailContainer.bottom
-                            anchors.horizontalCenter: thumbnailContainer.horizontalCenter
-                            anchors.topMargin: 4
-                            text: model.filename
-                            width: thumbnailContainer.width
-                            elide: Text.ElideMiddle
-                            horizontalAlignment: Text.AlignHCenter
-                            font.pointSize: 9
-                        }
-                        
-                        // Mouse interaction area
-                        MouseArea {
-                            id: mouseArea
-                            anchors.fill: parent
-                            hoverEnabled: true
-                            
-                            // Show detailed tooltip on hover
-                            Controls.ToolTip {
-                                visible: mouseArea.containsMouse
-                                delay: 500
-                                timeout: 5000
-                                
-                                contentItem: ColumnLayout {
-                                    spacing: 4
-                                    
-                                    Controls.Label {
-                                        text: "<b>" + model.filename + "</b>"
-                                        wrapMode: Text.WordWrap
-                                        Layout.maximumWidth: 300
-                                    }
-                                    
-                                    Controls.Label {
-                                        text: "<b>Size:</b> " + model.fileSizeFormatted
-                                    }
-                                    
-                                    Controls.Label {
-                                        text: "<b>Modified:</b> " + Qt.formatDateTime(model.lastModified, "yyyy-MM-dd hh:mm")
-                                    }
-                                    
-                                    Controls.Label {
-                                        text: "<b>Path:</b> " + model.filepath
-                                        elide: Text.ElideMiddle
-                                        Layout.maximumWidth: 300
-                                    }
-                                }
-                            }
-                            
-                            onClicked: {
-                                // Select when clicking anywhere on the item
-                                console.log("Opening video: " + model.filepath);
-                                // Call the Python method directly
-                                gallery.openVideoInTrimmer(model.filepath);
-                            }
-                        }
-                    }
-                    
-                    // Empty state
-                    Controls.Pane {
-                        anchors.centerIn: parent
-                        visible: galleryGrid.count === 0
-                        
-                        ColumnLayout {
-                            anchors.centerIn: parent
-                            spacing: Kirigami.Units.largeSpacing
-                            
-                            Kirigami.Icon {
-                                source: "folder-videos"
-                                implicitWidth: Kirigami.Units.iconSizes.huge
-                                implicitHeight: Kirigami.Units.iconSizes.huge
-                                Layout.alignment: Qt.AlignHCenter
-                            }
-                            
-                            Controls.Label {
-                                text: "No video files found"
-                                font.bold: true
-                                Layout.alignment: Qt.AlignHCenter
-                            }
-                            
-                            Controls.Label {
-                                text: "Try a different directory or add some videos"
-                                Layout.alignment: Qt.AlignHCenter
-                            }
-                        }
-                    }
-                }
-            }
-            
-            // Status bar
-            Rectangle {
-                Layout.fillWidth: true
-                Layout.preferredHeight: statusLayout.height + Kirigami.Units.smallSpacing * 2
-                color: Kirigami.Theme.backgroundColor
-                
-                RowLayout {
-                    id: statusLayout
-                    anchors {
-                        left: parent.left
-                        right: parent.right
-                        verticalCenter: parent.verticalCenter
-                        margins: Kirigami.Units.smallSpacing
-                    }
-                    
-                    Controls.Label {
-                        text: galleryGrid.count + " videos found in " + initialDirectory
-                        Layout.fillWidth: true
-                        elide: Text.ElideMiddle
-                    }
-                    
-                    Controls.Button {
-                        text: "Refresh"
-                        icon.name: "view-refresh"
-                        onClicked: gallery.loadFromDirectory(initialDirectory)
-                    }
-                }
-            }
-        }
-    }
-    
-    // Get the application directory for launching the trimmer
-    readonly property string applicationDirPath: {
-        // Extract the application directory from the QML file path
-        var path = Qt.resolvedUrl(".")
-        path = path.replace("file://", "")
-        path = path.substring(0, path.lastIndexOf("/"))
-        return path
-    }
-    
-    Component.onCompleted: {
-        console.log("Gallery started")
-        console.log("Looking for videos in: " + initialDirectory)
-        
-        // Small delay to ensure the UI is ready before loading data
-        loadTimer.start()
-    }
-    
-    Timer {
-        id: loadTimer
-        interval: 100
-        repeat: false
-        onTriggered: {
-            // Set initial sort (by name)
-            gallery.sortBy(gallery.filenameRole)
-        }
-    }
-}
-"""
-
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -42,6 +42,12 @@ Kirigami.ApplicationWindow {
         onCompressionFinished: {
             compressionBusy = false
         }
+        
+        onCompressionProgressChanged: function(percent) {
+            successNotification.text = "Compressing video... " + percent + "%"
+            successNotification.visible = true
+            hideTimer.restart()
+        }
     }
     
     // Timer to hide notifications
@@ -479,7 +485,7 @@ Kirigami.ApplicationWindow {
                     Controls.Button {
                         text: "Trim"
                         icon.name: "edit-cut"
-                        enabled: !root.trimComplete && trimmer.startTime < trimmer.endTime
+                        enabled: !root.trimComplete && !compressionBusy && trimmer.startTime < trimmer.endTime
                         
                         onClicked: {
                             trimmer.createTrim()